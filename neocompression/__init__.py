@@ -1,6 +1,8 @@
+from .archive import NeoArchive
 from .core import (
+    compress_many,
     compress_path,
     decompress_file,
 )
 
-__all__ = ["compress_path", "decompress_file"]
+__all__ = ["NeoArchive", "compress_many", "compress_path", "decompress_file"]
@@ -0,0 +1,204 @@
+import io
+import json
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from .core import MAGIC, binary_to_bytes, decompress_binary_chunk
+
+
+def _normalize_name(name: str) -> str:
+    # Archives built on Windows store paths with backslashes
+    return name.replace("\\", "/")
+
+
+class NeoArchive:
+    """Read-only random access to the files inside a .neo container.
+
+    The container header is parsed once; file data is decoded chunk by
+    chunk as readers touch it. Decoded chunks are kept in an LRU cache
+    bounded by ``cache_bytes`` and shared by every reader of the archive.
+    """
+
+    def __init__(self, container_path: str | Path, cache_bytes: int = 64 * 1024 * 1024):
+        self.path = Path(container_path)
+        self.cache_bytes = cache_bytes
+        self._cache: "OrderedDict[int, bytes]" = OrderedDict()
+        self._cached_bytes = 0
+        self._lock = threading.Lock()
+        self._fh = open(self.path, "rb")
+
+        try:
+            self._read_header()
+        except Exception:
+            self._fh.close()
+            raise
+
+    def _read_header(self) -> None:
+        if self._fh.readline() != (MAGIC + "\n").encode("ascii"):
+            raise ValueError("Not a NeoCompression file")
+
+        header_json = self._fh.readline()
+        if self._fh.readline() != b"\n":
+            raise ValueError("Corrupt container header")
+        container = json.loads(header_json)
+        data_start = self._fh.tell()
+
+        self._chunk_keys: Dict[str, Dict[str, str]] = container["master_key"].get(
+            "chunk_keys", {}
+        )
+
+        # Chunk headers are "\c<id>:<chars>:", so every chunk's position in
+        # the stream follows from the per-chunk metadata without scanning.
+        self._spans: List[Tuple[int, str, int]] = []
+        offset = data_start
+        for meta in container["metadata"]:
+            header = f"\\c{meta['chunk_id']}:{meta['compressed_chars']}:"
+            self._spans.append((offset, header, meta["compressed_chars"]))
+            offset += len(header) + meta["compressed_chars"]
+
+        # Per file: sorted byte offsets and the chunk ids that start there
+        self._files: Dict[str, Tuple[List[int], List[int], int]] = {}
+        pieces: Dict[str, List[Tuple[int, int, int]]] = {}
+        for chunk_id, entry in enumerate(container["index"]):
+            if entry["offset_bits"] % 8 or entry["length_bits"] % 8:
+                raise ValueError(
+                    "Random access needs chunk sizes that are a multiple of 8 bits"
+                )
+            name = _normalize_name(entry["path"])
+            if name == "." and container.get("root_is_file"):
+                name = container["root_name"]
+            pieces.setdefault(name, []).append(
+                (entry["offset_bits"] // 8, entry["length_bits"] // 8, chunk_id)
+            )
+
+        for name, file_pieces in pieces.items():
+            file_pieces.sort()
+            offsets = [p[0] for p in file_pieces]
+            chunk_ids = [p[2] for p in file_pieces]
+            size = file_pieces[-1][0] + file_pieces[-1][1]
+            self._files[name] = (offsets, chunk_ids, size)
+
+    def namelist(self) -> List[str]:
+        return sorted(self._files)
+
+    def getsize(self, name: str) -> int:
+        return self._lookup(name)[2]
+
+    def open(self, name: str) -> "NeoArchiveReader":
+        """Return a seekable binary reader for one file in the archive"""
+        offsets, chunk_ids, size = self._lookup(name)
+        return NeoArchiveReader(self, offsets, chunk_ids, size)
+
+    def close(self) -> None:
+        with self._lock:
+            self._fh.close()
+            self._cache.clear()
+            self._cached_bytes = 0
+
+    def __enter__(self) -> "NeoArchive":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _lookup(self, name: str) -> Tuple[List[int], List[int], int]:
+        try:
+            return self._files[_normalize_name(name)]
+        except KeyError:
+            raise KeyError(f"No such file in archive: {name}") from None
+
+    def _chunk(self, chunk_id: int) -> bytes:
+        offset, header, length = self._spans[chunk_id]
+        with self._lock:
+            data = self._cache.get(chunk_id)
+            if data is not None:
+                self._cache.move_to_end(chunk_id)
+                return data
+            self._fh.seek(offset)
+            raw = self._fh.read(len(header) + length).decode("ascii")
+
+        # Decode without the lock so readers of other chunks are not held up
+        if not raw.startswith(header):
+            raise ValueError(f"Corrupt chunk header for chunk {chunk_id}")
+        chunk_key = self._chunk_keys.get(f"K{chunk_id}", {})
+        bits = decompress_binary_chunk(raw[len(header) :], chunk_key)
+        data = binary_to_bytes(bits) if bits else b""
+
+        with self._lock:
+            if chunk_id in self._cache:
+                # Another reader decoded it meanwhile
+                self._cache.move_to_end(chunk_id)
+                return self._cache[chunk_id]
+            if len(data) <= self.cache_bytes:
+                self._cache[chunk_id] = data
+                self._cached_bytes += len(data)
+                while self._cached_bytes > self.cache_bytes:
+                    _, evicted = self._cache.popitem(last=False)
+                    self._cached_bytes -= len(evicted)
+            return data
+
+
+class NeoArchiveReader(io.RawIOBase):
+    """Seekable reader over one file of a NeoArchive"""
+
+    def __init__(self, archive: NeoArchive, offsets: List[int], chunk_ids: List[int], size: int):
+        super().__init__()
+        self._archive = archive
+        self._offsets = offsets
+        self._chunk_ids = chunk_ids
+        self._size = size
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if pos < 0:
+            raise ValueError(f"Negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def read(self, size: int = -1) -> bytes:
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+        end = self._size if size is None or size < 0 else min(self._size, self._pos + size)
+        if self._pos >= end:
+            return b""
+
+        parts: List[bytes] = []
+        idx = bisect_right(self._offsets, self._pos) - 1
+        while self._pos < end:
+            chunk_start = self._offsets[idx]
+            data = self._archive._chunk(self._chunk_ids[idx])
+            piece = data[self._pos - chunk_start : end - chunk_start]
+            if not piece:
+                break
+            parts.append(piece)
+            self._pos += len(piece)
+            idx += 1
+        return b"".join(parts)
+
+    def readall(self) -> bytes:
+        return self.read()
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
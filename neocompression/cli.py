@@ -1,7 +1,45 @@
 import argparse
+import json
+import time
 from pathlib import Path
 
-from .core import compress_path, decompress_file
+from .core import compress_many, compress_path, decompress_file
+
+
+def read_manifest(manifest: Path):
+    """Read (source, output) pairs from a JSON-lines manifest"""
+    jobs = []
+    base = manifest.parent
+    for line_no, line in enumerate(manifest.read_text(encoding="utf-8").splitlines(), 1):
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+            source, output = entry["source"], entry["output"]
+        except (ValueError, KeyError, TypeError):
+            raise SystemExit(
+                f"{manifest}:{line_no}: expected {{\"source\": ..., \"output\": ...}}"
+            )
+        jobs.append((base / source, base / output))
+    return jobs
+
+
+def print_batch_report(results, elapsed: float) -> None:
+    failed = [r for r in results if r["error"] is not None]
+    in_bytes = sum(r["input_bytes"] for r in results if r["error"] is None)
+    out_bytes = sum(r["output_bytes"] for r in results if r["error"] is None)
+
+    for r in failed:
+        print(f"FAILED {r['source']}: {r['error']}")
+
+    print(f"Archives:   {len(results) - len(failed)} ok, {len(failed)} failed")
+    print(f"Input:      {in_bytes / 1e6:.2f} MB")
+    print(f"Output:     {out_bytes / 1e6:.2f} MB")
+    if in_bytes:
+        print(f"Ratio:      {out_bytes / in_bytes:.3f}")
+    print(f"Elapsed:    {elapsed:.2f} s")
+    if elapsed > 0:
+        print(f"Throughput: {in_bytes / 1e6 / elapsed:.2f} MB/s")
 
 
 def main() -> None:
@@ -27,12 +65,51 @@ def main() -> None:
         "output-dir", type=str, help="Directory to restore original files into"
     )
 
+    p_batch = subparsers.add_parser(
+        "batch", help="Compress many sources listed in a JSON-lines manifest"
+    )
+    p_batch.add_argument(
+        "manifest",
+        type=str,
+        help='Manifest with one {"source": ..., "output": ...} per line; '
+        "relative paths are resolved against the manifest's directory",
+    )
+    p_batch.add_argument(
+        "--chunk-bits",
+        type=int,
+        default=8192,
+        help="Chunk size in bits for internal processing",
+    )
+    p_batch.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: one per CPU)",
+    )
+    p_batch.add_argument(
+        "--share-dict",
+        action="store_true",
+        help="Share one pattern dictionary across inputs with the same file types",
+    )
+
     args = parser.parse_args()
 
     if args.command == "compress":
         compress_path(args.source, args.output, chunk_bits=args.chunk_bits)
     elif args.command == "decompress":
         decompress_file(args.container, args.output_dir)
+    elif args.command == "batch":
+        jobs = read_manifest(Path(args.manifest))
+        started = time.perf_counter()
+        results = compress_many(
+            jobs,
+            chunk_bits=args.chunk_bits,
+            workers=args.workers,
+            share_dict=args.share_dict,
+        )
+        print_batch_report(results, time.perf_counter() - started)
+        if any(r["error"] is not None for r in results):
+            raise SystemExit(1)
 
 
 if __name__ == "__main__":
@@ -1,12 +1,29 @@
 import os
+import time
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Tuple
 
 MAGIC = "NEOCMP1"
 
+# Bits sampled per group of similar inputs when compress_many shares a
+# dictionary between them.
+SHARED_DICT_SAMPLE_BITS = 1 << 20
 
-def file_to_binary(path: Path) -> str:
-    data = path.read_bytes()
+# Scan steps between progress reports while building a dictionary
+DICT_PROGRESS_SLICE = 1 << 14
+
+# progress(phase, done, total, chunks_done, chunks_total)
+# Phases are "read", "analyze", "encode" and "decode". done/total count
+# input bytes, except for "analyze" where they count dictionary scan steps.
+ProgressCallback = Callable[[str, int, int, int, int], None]
+
+
+def file_to_binary(path: Path, max_bytes: int | None = None) -> str:
+    if max_bytes is None:
+        data = path.read_bytes()
+    else:
+        with path.open("rb") as fh:
+            data = fh.read(max_bytes)
     return "".join(f"{byte:08b}" for byte in data)
 
 
@@ -23,16 +40,32 @@ def walk_path(root: Path) -> List[Path]:
     return [p for p in root.rglob("*") if p.is_file()]
 
 
-def build_compression_dict(binary_source: str, max_patterns: int = 94) -> Dict[str, str]:
+def build_compression_dict(
+    binary_source: str,
+    max_patterns: int = 94,
+    progress: ProgressCallback | None = None,
+) -> Dict[str, str]:
     patterns: Dict[str, int] = {}
     min_len = 4
     max_len = min(32, max(len(binary_source) // 10, min_len))
 
+    scans: List[Tuple[int, int, int]] = []
     for length in range(max_len, min_len - 1, -1):
         step = max(1, length // 2)
-        for i in range(0, len(binary_source) - length + 1, step):
-            pattern = binary_source[i : i + length]
-            patterns[pattern] = patterns.get(pattern, 0) + 1
+        count = len(range(0, len(binary_source) - length + 1, step))
+        scans.append((length, step, count))
+    total_steps = sum(count for _, _, count in scans)
+    done_steps = 0
+
+    for length, step, count in scans:
+        for first in range(0, count, DICT_PROGRESS_SLICE):
+            last = min(count, first + DICT_PROGRESS_SLICE)
+            for i in range(first * step, last * step, step):
+                pattern = binary_source[i : i + length]
+                patterns[pattern] = patterns.get(pattern, 0) + 1
+            done_steps += last - first
+            if progress is not None:
+                progress("analyze", done_steps, total_steps, 0, 0)
 
     sorted_patterns = sorted(
         patterns.items(), key=lambda x: (x[1], len(x[0])), reverse=True
@@ -43,113 +76,86 @@ def build_compression_dict(binary_source: str, max_patterns: int = 94) -> Dict[s
 
     for pattern, count in sorted_patterns[:max_patterns]:
         if count > 1 and ascii_code <= 126:
+            if chr(ascii_code) == "\\":
+                # Backslash introduces escapes in the compressed stream
+                ascii_code += 1
+                if ascii_code > 126:
+                    break
             compression_dict[pattern] = chr(ascii_code)
             ascii_code += 1
 
     return compression_dict
 
 
-def analyze_chunk_structure(
-    binary_chunk: str, min_segment_size: int = 4, max_segment_size: int = 32
-):
-    chunk_length = len(binary_chunk)
-    analysis = {
-        "total_bits": chunk_length,
-        "optimal_segments": [],
-        "leftover_bits": None,
-        "segment_sizes": [],
-        "recommended_padding": 0,
-    }
-
-    if chunk_length == 0:
-        return analysis
-
-    if chunk_length < 64:
-        analysis["optimal_segments"] = [binary_chunk]
-        analysis["segment_sizes"] = [chunk_length]
-        return analysis
-
-    pattern_scores: Dict[int, float] = {}
-
-    for seg_size in range(max_segment_size, min_segment_size - 1, -1):
-        segment_count = chunk_length // seg_size
-        remainder = chunk_length % seg_size
-
-        if segment_count == 0:
-            continue
-
-        pattern_frequency: Dict[str, int] = {}
-        for i in range(0, segment_count * seg_size, seg_size):
-            segment = binary_chunk[i : i + seg_size]
-            pattern_frequency[segment] = pattern_frequency.get(segment, 0) + 1
-
-        repeat_score = sum(count - 1 for count in pattern_frequency.values())
-        pattern_scores[seg_size] = repeat_score / max(segment_count, 1)
-
-    if pattern_scores:
-        best_size = max(pattern_scores.keys(), key=lambda k: pattern_scores[k])
-        segment_count = chunk_length // best_size
-
-        for i in range(0, segment_count * best_size, best_size):
-            seg = binary_chunk[i : i + best_size]
-            analysis["optimal_segments"].append(seg)
-            analysis["segment_sizes"].append(best_size)
-
-        leftover_start = segment_count * best_size
-        if leftover_start < chunk_length:
-            analysis["leftover_bits"] = binary_chunk[leftover_start:]
-            if len(analysis["leftover_bits"]) >= min_segment_size:
-                analysis["optimal_segments"].append(analysis["leftover_bits"])
-                analysis["segment_sizes"].append(len(analysis["leftover_bits"]))
-            else:
-                analysis["recommended_padding"] = (
-                    min_segment_size - len(analysis["leftover_bits"])
-                )
-    else:
-        segment_size = min(64, max(8, 2 ** (chunk_length.bit_length() - 1)))
-        for i in range(0, chunk_length, segment_size):
-            seg = binary_chunk[i : i + segment_size]
-            if seg:
-                analysis["optimal_segments"].append(seg)
-                analysis["segment_sizes"].append(len(seg))
-
-    return analysis
+def build_pattern_trie(pattern_dict: Dict[str, str]) -> Dict:
+    # Nested dicts keyed by "0"/"1"; the "" key holds the symbol of a
+    # pattern ending at that node.
+    trie: Dict = {}
+    for pattern, symbol in pattern_dict.items():
+        node = trie
+        for bit in pattern:
+            node = node.setdefault(bit, {})
+        node[""] = symbol
+    return trie
 
 
 def compress_binary_chunk(
-    binary_chunk: str, global_dict: Dict[str, str] | None = None
+    binary_chunk: str,
+    global_dict: Dict[str, str] | None = None,
+    trie: Dict | None = None,
 ) -> Tuple[str, Dict[str, str], Dict]:
     if not binary_chunk:
-        return "", {}, {"has_leftover": False, "padding_bits": 0, "total_bits": 0}
-
-    analysis = analyze_chunk_structure(binary_chunk)
+        return "", {}, {"total_bits": 0, "segment_count": 0}
 
-    pattern_dict = global_dict or build_compression_dict(binary_chunk)
+    if global_dict:
+        pattern_dict = global_dict
+    else:
+        # A trie passed in alongside an empty global dict cannot match
+        # the chunk's own patterns
+        pattern_dict = build_compression_dict(binary_chunk)
+        trie = None
     chunk_key = {v: k for k, v in pattern_dict.items()}
+    if trie is None:
+        trie = build_pattern_trie(pattern_dict)
 
     compressed_parts: List[str] = []
-    leftover_handling: Dict = {
-        "has_leftover": analysis["leftover_bits"] is not None,
-        "padding_bits": analysis["recommended_padding"],
-        "total_bits": analysis["total_bits"],
-    }
+    literal_start = 0
+    i = 0
+    n = len(binary_chunk)
+
+    # Greedy longest match: at every position take the longest dictionary
+    # pattern starting there, and collect unmatched bits into literal runs.
+    while i < n:
+        node = trie
+        match_end = -1
+        symbol = ""
+        j = i
+        while j < n:
+            node = node.get(binary_chunk[j])
+            if node is None:
+                break
+            j += 1
+            if "" in node:
+                match_end = j
+                symbol = node[""]
 
-    for seg, seg_size in zip(
-        analysis["optimal_segments"], analysis["segment_sizes"]
-    ):
-        if seg in pattern_dict:
-            compressed_parts.append(pattern_dict[seg])
-        elif seg_size >= 8:
-            compressed_parts.append(f"\\s{seg_size}:{seg}")
-        else:
-            compressed_parts.append(f"\\t{seg}")
+        if match_end == -1:
+            i += 1
+            continue
 
-    if analysis["recommended_padding"] > 0:
-        padding_bits = "0" * analysis["recommended_padding"]
-        compressed_parts.append(f"\\p{padding_bits}")
-        leftover_handling["padding_used"] = padding_bits
+        if literal_start < i:
+            literal = binary_chunk[literal_start:i]
+            compressed_parts.append(f"\\s{len(literal)}:{literal}")
+        compressed_parts.append(symbol)
+        i = literal_start = match_end
 
-    return "".join(compressed_parts), chunk_key, leftover_handling
+    if literal_start < n:
+        literal = binary_chunk[literal_start:]
+        compressed_parts.append(f"\\s{len(literal)}:{literal}")
+
+    chunk_stats: Dict = {"total_bits": n, "segment_count": len(compressed_parts)}
+
+    return "".join(compressed_parts), chunk_key, chunk_stats
 
 
 def decompress_binary_chunk(compressed_chunk: str, chunk_key: Dict[str, str]) -> str:
@@ -200,19 +206,29 @@ def decompress_binary_chunk(compressed_chunk: str, chunk_key: Dict[str, str]) ->
     return "".join(binary_parts)
 
 
-def compress_binary_stream(binary_chunks: List[str]):
+def compress_binary_stream(
+    binary_chunks: List[str],
+    progress: ProgressCallback | None = None,
+    global_dict: Dict[str, str] | None = None,
+):
     if not binary_chunks:
         return "", {}, []
 
     all_data = "".join(binary_chunks)
-    global_dict = build_compression_dict(all_data) if all_data else {}
+    if global_dict is None:
+        global_dict = build_compression_dict(all_data, progress=progress) if all_data else {}
+    trie = build_pattern_trie(global_dict) if global_dict else None
 
     compressed_chunks: List[str] = []
     chunk_metadata: List[Dict] = []
     chunk_keys: Dict[str, Dict[str, str]] = {}
+    total_bytes = len(all_data) // 8
+    done_bytes = 0
 
     for idx, chunk in enumerate(binary_chunks):
-        compressed, chunk_key, leftover = compress_binary_chunk(chunk, global_dict)
+        compressed, chunk_key, chunk_stats = compress_binary_chunk(
+            chunk, global_dict, trie
+        )
         key_id = f"K{idx}"
         chunk_keys[key_id] = chunk_key
 
@@ -221,15 +237,17 @@ def compress_binary_stream(binary_chunks: List[str]):
             "key_id": key_id,
             "original_bits": len(chunk),
             "compressed_chars": len(compressed),
-            "segment_count": len(analyze_chunk_structure(chunk)["optimal_segments"]),
-            "has_leftover": leftover["has_leftover"],
-            "padding_used": leftover.get("padding_used", ""),
+            "segment_count": chunk_stats["segment_count"],
         }
         chunk_metadata.append(metadata)
 
         header = f"\\c{idx}:{len(compressed)}:"
         compressed_chunks.append(header + compressed)
 
+        done_bytes += len(chunk) // 8
+        if progress is not None:
+            progress("encode", done_bytes, total_bytes, idx + 1, len(binary_chunks))
+
     compressed_stream = "".join(compressed_chunks)
 
     master_key = {
@@ -241,9 +259,16 @@ def compress_binary_stream(binary_chunks: List[str]):
     return compressed_stream, master_key, chunk_metadata
 
 
-def decompress_binary_stream(compressed_stream: str, master_key: Dict) -> List[str]:
+def decompress_binary_stream(
+    compressed_stream: str,
+    master_key: Dict,
+    progress: ProgressCallback | None = None,
+    total_bits: int = 0,
+) -> List[str]:
     binary_chunks: List[str] = []
     chunk_keys = master_key["chunk_keys"]
+    total_chunks = master_key.get("total_chunks", 0)
+    done_bits = 0
 
     i = 0
     while i < len(compressed_stream):
@@ -271,27 +296,45 @@ def decompress_binary_stream(compressed_stream: str, master_key: Dict) -> List[s
         binary_chunks.append(binary_chunk)
 
         i = data_end
+        done_bits += len(binary_chunk)
+        if progress is not None:
+            progress(
+                "decode", done_bits // 8, total_bits // 8, len(binary_chunks), total_chunks
+            )
 
     return binary_chunks
 
 
-def compress_path(path: str | Path, out_file: str | Path, chunk_bits: int = 8192) -> None:
+def compress_path(
+    path: str | Path,
+    out_file: str | Path,
+    chunk_bits: int = 8192,
+    progress: ProgressCallback | None = None,
+    global_dict: Dict[str, str] | None = None,
+) -> None:
     root = Path(path)
     files = walk_path(root)
 
     all_binary_chunks: List[str] = []
     file_index: List[Dict] = []
+    total_bytes = sum(f.stat().st_size for f in files) if progress is not None else 0
+    read_bytes = 0
 
     for f in files:
         rel = str(f.relative_to(root))
         bits = file_to_binary(f)
+        read_bytes += len(bits) // 8
+        if progress is not None:
+            progress("read", read_bytes, total_bytes, 0, 0)
         # Split into chunks
         for i in range(0, len(bits), chunk_bits):
             chunk = bits[i : i + chunk_bits]
             all_binary_chunks.append(chunk)
             file_index.append({"path": rel, "offset_bits": i, "length_bits": len(chunk)})
 
-    compressed_stream, master_key, metadata = compress_binary_stream(all_binary_chunks)
+    compressed_stream, master_key, metadata = compress_binary_stream(
+        all_binary_chunks, progress, global_dict
+    )
 
     # Container format: MAGIC\nJSON_META\n\nDATA
     import json
@@ -308,7 +351,146 @@ def compress_path(path: str | Path, out_file: str | Path, chunk_bits: int = 8192
     Path(out_file).write_bytes(header.encode("utf-8") + compressed_stream.encode("ascii"))
 
 
-def decompress_file(container_path: str | Path, out_dir: str | Path) -> None:
+def _job_result(source: str, output: str, input_bytes: int, error: str | None = None) -> Dict:
+    return {
+        "source": source,
+        "output": output,
+        "input_bytes": input_bytes,
+        "output_bytes": 0,
+        "seconds": 0.0,
+        "error": error,
+    }
+
+
+def _compress_job(
+    source: str,
+    output: str,
+    chunk_bits: int,
+    global_dict: Dict[str, str] | None,
+    input_bytes: int,
+) -> Dict:
+    started = time.perf_counter()
+    result = _job_result(source, output, input_bytes)
+    try:
+        if not Path(source).exists():
+            raise FileNotFoundError(f"Path not found: {source}")
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+        compress_path(source, output, chunk_bits=chunk_bits, global_dict=global_dict)
+        result["output_bytes"] = Path(output).stat().st_size
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["seconds"] = time.perf_counter() - started
+    return result
+
+
+def _similarity_key(files: List[Path]) -> Tuple[str, ...]:
+    return tuple(sorted({f.suffix.lower() for f in files}))
+
+
+def build_shared_dicts(
+    inputs: List[List[Path]],
+    keys: List[Tuple[str, ...]],
+    sample_bits: int = SHARED_DICT_SAMPLE_BITS,
+) -> Dict[Tuple[str, ...], Dict[str, str]]:
+    # Inputs with the same set of file extensions are treated as similar
+    # and share one dictionary built from a bounded sample of their data.
+    # ``inputs`` holds each source's files and ``keys`` their similarity keys.
+    groups: Dict[Tuple[str, ...], List[List[Path]]] = {}
+    for files, key in zip(inputs, keys):
+        groups.setdefault(key, []).append(files)
+
+    shared: Dict[Tuple[str, ...], Dict[str, str]] = {}
+    for key, members in groups.items():
+        if len(members) < 2:
+            continue
+        sample: List[str] = []
+        remaining = sample_bits
+        for files in members:
+            for f in files:
+                try:
+                    bits = file_to_binary(f, max_bytes=remaining // 8)
+                except OSError:
+                    # The job itself will report an unreadable input
+                    continue
+                sample.append(bits)
+                remaining -= len(bits)
+                if remaining < 8:
+                    break
+            if remaining < 8:
+                break
+        if any(sample):
+            shared[key] = build_compression_dict("".join(sample))
+    return shared
+
+
+def compress_many(
+    jobs: List[Tuple[str | Path, str | Path]],
+    chunk_bits: int = 8192,
+    workers: int | None = None,
+    share_dict: bool = False,
+) -> List[Dict]:
+    """Compress many (source, output) pairs in one process pool.
+
+    Jobs are submitted largest input first. Returns one result dict per job,
+    in input order; a failed job has its message in "error".
+    """
+    sources = [Path(source) for source, _ in jobs]
+    inputs: List[List[Path]] = [[] for _ in jobs]
+    sizes = [0] * len(jobs)
+    results: List[Dict] = [{} for _ in jobs]
+
+    # An input that cannot be sized fails on its own without stopping the batch
+    for i, source in enumerate(sources):
+        try:
+            inputs[i] = walk_path(source)
+            sizes[i] = sum(f.stat().st_size for f in inputs[i])
+        except OSError as e:
+            results[i] = _job_result(
+                str(source), str(jobs[i][1]), 0, error=f"{type(e).__name__}: {e}"
+            )
+    pending = [i for i in range(len(jobs)) if not results[i]]
+    order = sorted(pending, key=lambda i: sizes[i], reverse=True)
+
+    dicts: List[Dict[str, str] | None] = [None] * len(jobs)
+    if share_dict:
+        keys = {i: _similarity_key(inputs[i]) for i in pending}
+        shared = build_shared_dicts(
+            [inputs[i] for i in pending], [keys[i] for i in pending]
+        )
+        for i in pending:
+            dicts[i] = shared.get(keys[i])
+
+    args = [
+        (str(sources[i]), str(jobs[i][1]), chunk_bits, dicts[i], sizes[i])
+        for i in range(len(jobs))
+    ]
+
+    if workers == 1 or len(order) <= 1:
+        for i in order:
+            results[i] = _compress_job(*args[i])
+        return results
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {i: pool.submit(_compress_job, *args[i]) for i in order}
+        for i, future in futures.items():
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                # e.g. BrokenProcessPool when a worker is killed
+                source, output, _, _, input_bytes = args[i]
+                results[i] = _job_result(
+                    source, output, input_bytes, error=f"{type(e).__name__}: {e}"
+                )
+    return results
+
+
+def decompress_file(
+    container_path: str | Path,
+    out_dir: str | Path,
+    progress: ProgressCallback | None = None,
+) -> None:
     import json
 
     data = Path(container_path).read_bytes()
@@ -328,7 +510,12 @@ def decompress_file(container_path: str | Path, out_dir: str | Path) -> None:
     master_key = container["master_key"]
     index = container["index"]
 
-    binary_chunks = decompress_binary_stream(compressed_stream, master_key)
+    binary_chunks = decompress_binary_stream(
+        compressed_stream,
+        master_key,
+        progress,
+        total_bits=sum(meta["length_bits"] for meta in index),
+    )
 
     # Rebuild files
     out_root = Path(out_dir)
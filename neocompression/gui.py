@@ -1,11 +1,112 @@
 import json
+import multiprocessing
+import os
+import queue
+import shutil
+import tempfile
+import time
 import tkinter as tk
+from collections import deque
 from tkinter import filedialog, messagebox, ttk
 from pathlib import Path
-from threading import Thread
 
 from .core import compress_path, decompress_file
 
+# How often the window drains worker messages, and how often a worker
+# is allowed to post a progress update.
+POLL_INTERVAL_MS = 100
+PROGRESS_INTERVAL = 0.1
+
+# Share of the progress bar given to each phase. Dictionary discovery
+# dominates compression time, so it gets most of the bar.
+PHASE_SPANS = {
+    "read": (0, 3),
+    "analyze": (3, 95),
+    "encode": (95, 100),
+    "decode": (0, 100),
+}
+PHASE_LABELS = {
+    "read": "Reading",
+    "analyze": "Analyzing patterns",
+    "encode": "Encoding",
+    "decode": "Decoding",
+}
+
+
+def _make_partial(kind: str, target: Path) -> Path:
+    """Create a unique place for a job to write before its output is moved into place"""
+    if kind == "compress":
+        fd, name = tempfile.mkstemp(
+            dir=target.parent, prefix=f".{target.name}.", suffix=".part"
+        )
+        os.close(fd)
+        return Path(name)
+    target.mkdir(parents=True, exist_ok=True)
+    return Path(tempfile.mkdtemp(dir=target, prefix=".neo-partial-"))
+
+
+def _remove_partial(path: Path):
+    if path.is_dir():
+        shutil.rmtree(path, ignore_errors=True)
+    elif path.exists():
+        path.unlink()
+
+
+def _run_job(
+    kind: str, source: str, target: str, partial: str, messages, commit_lock, committed
+):
+    """Worker process entry point; reports back through ``messages``
+
+    Moving finished output into place happens under ``commit_lock`` and ends
+    by setting ``committed``, so a cancel never interrupts it half way.
+    """
+    source_path = Path(source)
+    target_path = Path(target)
+    partial_path = Path(partial)
+    last_sent = 0.0
+    last_phase = None
+
+    def progress(phase, done, total, chunks_done, chunks_total):
+        nonlocal last_sent, last_phase
+        now = time.monotonic()
+        if phase == last_phase and now - last_sent < PROGRESS_INTERVAL and done < total:
+            return
+        last_sent = now
+        last_phase = phase
+        messages.put(("progress", phase, done, total, chunks_done, chunks_total))
+
+    try:
+        if kind == "compress":
+            compress_path(source_path, partial_path, progress=progress)
+            with commit_lock:
+                messages.put(("committing",))
+                os.replace(partial_path, target_path)
+                committed.set()
+        else:
+            decompress_file(source_path, partial_path, progress=progress)
+            with commit_lock:
+                messages.put(("committing",))
+                for item in sorted(partial_path.rglob("*")):
+                    if item.is_file():
+                        dest = target_path / item.relative_to(partial_path)
+                        dest.parent.mkdir(parents=True, exist_ok=True)
+                        os.replace(item, dest)
+                _remove_partial(partial_path)
+                committed.set()
+        messages.put(("done",))
+    except Exception as e:
+        _remove_partial(partial_path)
+        messages.put(("error", str(e)))
+
+
+def _format_eta(seconds: float) -> str:
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds}s"
+
 
 class NeoCompressionGUI:
     def __init__(self, root):
@@ -21,7 +122,23 @@ class NeoCompressionGUI:
         except Exception:
             pass  # DnD not available on all platforms
 
+        # Jobs run one at a time in a worker process so the Tk event loop
+        # keeps the GIL; the rest wait here as (kind, source, target).
+        self.mp = multiprocessing.get_context("spawn")
+        self.jobs = deque()
+        self.current_job = None
+        self.worker = None
+        self.messages = None
+        self.poll_id = None
+        self.partial = None
+        self.commit_lock = None
+        self.committed = None
+        self.phase = None
+        self.phase_mark = (0.0, 0)
+        self.closing = False
+
         self.create_widgets()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
     def create_widgets(self):
         # Title
@@ -88,9 +205,22 @@ class NeoCompressionGUI:
         )
         drop_zone.pack(pady=20, padx=40, fill=tk.BOTH, expand=True)
 
-        # Progress bar (hidden by default)
+        # Progress bar, details and cancel button (hidden by default)
+        self.job_frame = tk.Frame(self.root, bg="#f0f0f0")
         self.progress = ttk.Progressbar(
-            self.root, mode="indeterminate", length=400
+            self.job_frame, mode="determinate", length=400, maximum=100
+        )
+        self.progress.pack(side=tk.LEFT, padx=5)
+        self.cancel_btn = tk.Button(
+            self.job_frame,
+            text="Cancel",
+            command=self.cancel_job,
+            font=("Segoe UI", 9),
+            cursor="hand2",
+        )
+        self.cancel_btn.pack(side=tk.LEFT, padx=5)
+        self.details = tk.Label(
+            self.root, text="", bg="#f0f0f0", fg="#7f8c8d", font=("Segoe UI", 9)
         )
 
         # Status label
@@ -171,50 +301,208 @@ class NeoCompressionGUI:
         self.run_decompression(neo_path, Path(output_dir))
 
     def run_compression(self, source: Path, output: Path):
-        """Run compression in background thread"""
-        self.status.config(text=f"Compressing {source.name}...")
-        self.progress.pack(pady=10)
-        self.progress.start()
+        """Queue a compression job"""
+        self.enqueue_job("compress", source, output)
 
-        def task():
-            try:
-                compress_path(source, output)
-                self.root.after(0, lambda: self.on_complete(f"Compressed to {output.name}"))
-            except Exception as e:
-                self.root.after(0, lambda: self.on_error(str(e)))
+    def run_decompression(self, container: Path, output_dir: Path):
+        """Queue a decompression job"""
+        self.enqueue_job("decompress", container, output_dir)
+
+    def enqueue_job(self, kind: str, source: Path, target: Path):
+        """Add a job and start it if nothing else is running"""
+        self.jobs.append((kind, source, target))
+        if self.current_job is None:
+            self.start_next_job()
+        else:
+            self.update_details()
+
+    def start_next_job(self):
+        """Launch the next queued job in a worker process"""
+        if not self.jobs:
+            self.current_job = None
+            self.job_frame.pack_forget()
+            self.details.pack_forget()
+            return
 
-        Thread(target=task, daemon=True).start()
+        kind, source, target = self.current_job = self.jobs.popleft()
+        verb = "Compressing" if kind == "compress" else "Extracting"
+        self.status.config(text=f"{verb} {source.name}...", fg="#2c3e50")
+        self.progress.config(value=0)
+        self.cancel_btn.config(state=tk.NORMAL)
+        self.job_frame.pack(pady=10)
+        self.details.pack(pady=2)
+        self.details.config(text="Starting...")
 
-    def run_decompression(self, container: Path, output_dir: Path):
-        """Run decompression in background thread"""
-        self.status.config(text=f"Extracting {container.name}...")
-        self.progress.pack(pady=10)
-        self.progress.start()
+        try:
+            self.partial = _make_partial(kind, target)
+        except OSError as e:
+            self.on_error(str(e))
+            return
 
-        def task():
+        self.messages = self.mp.Queue()
+        self.commit_lock = self.mp.Lock()
+        self.committed = self.mp.Event()
+        self.phase = None
+        self.worker = self.mp.Process(
+            target=_run_job,
+            args=(
+                kind,
+                str(source),
+                str(target),
+                str(self.partial),
+                self.messages,
+                self.commit_lock,
+                self.committed,
+            ),
+            daemon=True,
+        )
+        self.worker.start()
+        self.poll_id = self.root.after(POLL_INTERVAL_MS, self.poll_worker)
+
+    def poll_worker(self):
+        """Drain worker messages and reschedule while the job is alive"""
+        if self.worker is None:
+            return
+
+        while True:
             try:
-                decompress_file(container, output_dir)
-                self.root.after(0, lambda: self.on_complete(f"Extracted to {output_dir}"))
-            except Exception as e:
-                self.root.after(0, lambda: self.on_error(str(e)))
+                message = self.messages.get_nowait()
+            except queue.Empty:
+                break
+
+            if message[0] == "progress":
+                self.on_progress(*message[1:])
+            elif message[0] == "committing":
+                self.cancel_btn.config(state=tk.DISABLED)
+                self.details.config(text="Finishing..." + self.queued_suffix())
+            elif message[0] == "done":
+                self.finish_job()
+                kind, source, target = self.current_job
+                if kind == "compress":
+                    self.on_complete(f"Compressed to {target.name}")
+                else:
+                    self.on_complete(f"Extracted to {target}")
+                return
+            elif message[0] == "error":
+                self.finish_job()
+                self.on_error(message[1])
+                return
+
+        if not self.worker.is_alive() and self.messages.empty():
+            exitcode = self.worker.exitcode
+            self.finish_job()
+            _remove_partial(self.partial)
+            self.on_error(f"Worker exited unexpectedly (code {exitcode})")
+            return
 
-        Thread(target=task, daemon=True).start()
+        self.poll_id = self.root.after(POLL_INTERVAL_MS, self.poll_worker)
+
+    def on_progress(self, phase, done, total, chunks_done, chunks_total):
+        """Update the progress bar and the phase's size, rate and ETA"""
+        now = time.monotonic()
+        if phase != self.phase:
+            # Rates are measured from the first report of each phase, so
+            # process start-up and earlier phases do not skew them.
+            self.phase = phase
+            self.phase_mark = (now, done)
+
+        low, high = PHASE_SPANS[phase]
+        fraction = done / total if total else 1.0
+        self.progress.config(value=low + (high - low) * fraction)
+
+        parts = [PHASE_LABELS[phase]]
+        if phase == "analyze":
+            parts[0] += f" {100 * fraction:.0f}%"
+        else:
+            parts[0] += f" {done / 1e6:.1f} / {total / 1e6:.1f} MB"
+        if chunks_total:
+            parts.append(f"chunk {chunks_done}/{chunks_total}")
+
+        mark_time, mark_done = self.phase_mark
+        elapsed = now - mark_time
+        if elapsed > 0 and done > mark_done:
+            rate = (done - mark_done) / elapsed
+            if phase != "analyze":
+                parts.append(f"{rate / 1e6:.2f} MB/s")
+            if done < total:
+                parts.append(f"ETA {_format_eta((total - done) / rate)}")
+        self.details.config(text="  |  ".join(parts) + self.queued_suffix())
+
+    def queued_suffix(self) -> str:
+        return f"  |  {len(self.jobs)} queued" if self.jobs else ""
+
+    def update_details(self):
+        text = self.details.cget("text").split("  |  ")
+        text = [part for part in text if not part.endswith("queued")]
+        self.details.config(text="  |  ".join(text) + self.queued_suffix())
+
+    def cancel_job(self):
+        """Stop the running job and remove its partial output"""
+        if self.worker is None:
+            return
+        kind, source, target = self.current_job
+        # Never block the Tk thread: if the worker is moving output into
+        # place, let it finish and have poll_worker report the result.
+        if not self.commit_lock.acquire(block=False):
+            self.cancel_btn.config(state=tk.DISABLED)
+            self.status.config(text=f"Finishing {source.name}...", fg="#2c3e50")
+            return
+        try:
+            if self.committed.is_set():
+                return
+            self.root.after_cancel(self.poll_id)
+            self.worker.terminate()
+            self.worker.join()
+        finally:
+            self.commit_lock.release()
+        self.finish_job()
+        _remove_partial(self.partial)
+        self.status.config(text=f"Cancelled {source.name}", fg="#e67e22")
+        self.start_next_job()
+
+    def finish_job(self):
+        """Release the worker process and its message queue"""
+        self.worker.join(timeout=1)
+        self.worker = None
+        self.messages.close()
+        self.messages = None
+        self.commit_lock = None
+        self.committed = None
+
+    def on_close(self):
+        """Cancel or finish the running job before the window goes away"""
+        self.closing = True
+        self.jobs.clear()
+        if self.worker is not None:
+            self.cancel_job()
+        if self.worker is not None:
+            # Output is being moved into place; close once that is done
+            self.root.after(POLL_INTERVAL_MS, self.on_close)
+            return
+        self.root.destroy()
 
     def on_complete(self, message: str):
         """Called when operation completes successfully"""
-        self.progress.stop()
-        self.progress.pack_forget()
+        if self.closing:
+            return
+        self.progress.config(value=100)
         self.status.config(text=message, fg="#27ae60")
+        self.start_next_job()
         messagebox.showinfo("Success", message)
-        self.root.after(3000, lambda: self.status.config(text="Ready", fg="#2c3e50"))
+        self.root.after(3000, self.reset_status)
 
     def on_error(self, error: str):
         """Called when operation fails"""
-        self.progress.stop()
-        self.progress.pack_forget()
+        if self.closing:
+            return
         self.status.config(text="Error occurred", fg="#e74c3c")
+        self.start_next_job()
         messagebox.showerror("Error", f"Operation failed:\n{error}")
-        self.root.after(3000, lambda: self.status.config(text="Ready", fg="#2c3e50"))
+        self.root.after(3000, self.reset_status)
+
+    def reset_status(self):
+        if self.current_job is None:
+            self.status.config(text="Ready", fg="#2c3e50")
 
 
 def run_gui():
@@ -225,4 +513,5 @@ def run_gui():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     run_gui()